@@ -9,8 +9,11 @@ Repository: https://github.com/rongsam/ComfyUI-JSNodes
 License: MIT
 """
 
+import logging
+import os
+
 from .audio_nodes import AudioPadToFrames, SaveSRT
-from .video_nodes import VideoStitching, SubtitleBurnIn
+from .video_nodes import VideoStitching, SubtitleBurnIn, BatchSubtitleBurnIn
 from .image_nodes import SaveImageOptional
 from .api_nodes import OllamaReleaseVRAM
 
@@ -19,6 +22,7 @@ NODE_CLASS_MAPPINGS = {
     "AudioPadToFrames": AudioPadToFrames,
     "VideoStitching": VideoStitching,
     "SubtitleBurnIn": SubtitleBurnIn,
+    "BatchSubtitleBurnIn": BatchSubtitleBurnIn,
     "SaveImageOptional": SaveImageOptional,
     "SaveSRT": SaveSRT,
     "OllamaReleaseVRAM": OllamaReleaseVRAM,
@@ -29,11 +33,20 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "AudioPadToFrames": "🔇 Audio Pad to Frames",
     "VideoStitching": "🎬 Video Stitching",
     "SubtitleBurnIn": "📝 Subtitle Burn-In",
+    "BatchSubtitleBurnIn": "📝 Batch Subtitle Burn-In",
     "SaveImageOptional": "💾 Save Image Optional",
     "SaveSRT": "💾 Save SRT",
     "OllamaReleaseVRAM": "🧠 Release VRAM from Ollama",
 }
 
+# Log level for all JSNodes modules (e.g. JSNODES_LOG_LEVEL=DEBUG for per-file detail)
+_log_level = os.environ.get("JSNODES_LOG_LEVEL")
+if _log_level:
+    try:
+        logging.getLogger(__name__).setLevel(_log_level.upper())
+    except ValueError:
+        print(f"⚠️ ComfyUI-JSNodes: ignoring invalid JSNODES_LOG_LEVEL={_log_level!r}")
+
 # Package metadata
 __version__ = "0.4.0"
 __all__ = ['NODE_CLASS_MAPPINGS', 'NODE_DISPLAY_NAME_MAPPINGS']
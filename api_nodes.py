@@ -4,9 +4,25 @@ API integration nodes for ComfyUI-JSNodes
 This module contains custom nodes for integrating with external APIs and services.
 """
 
-import urllib.request
-import urllib.error
-import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class _StaticIntervalRetry(Retry):
+    """
+    urllib3 retry policy that waits a fixed interval between attempts.
+
+    The interval is carried in backoff_factor so it survives Retry.new(), but
+    unlike the stock policy it is not grown exponentially per attempt.
+    """
+
+    def get_backoff_time(self):
+        return self.backoff_factor if self.history else 0
 
 
 class OllamaReleaseVRAM:
@@ -23,14 +39,71 @@ class OllamaReleaseVRAM:
     Inputs:
         ollama_url (STRING): Base URL for Ollama API (default: http://localhost:11434)
         trigger (optional): Any input to trigger execution in a workflow
+        use_cached_result (BOOLEAN, optional): Skip the /api/ps query if it reported
+            nothing loaded within the last few seconds (default: False). Only safe
+            when nothing else can load a model in between runs.
 
     Outputs:
         result (STRING): Summary of unloaded models and freed resources
     """
 
+    # Upper bound on concurrent unload requests (also the connection pool size)
+    MAX_PARALLEL_UNLOADS = 8
+
+    # Timeouts in seconds: fail fast when Ollama is unreachable, but give it
+    # time to actually evict a model once the request has been accepted
+    CONNECT_TIMEOUT_S = 3.05
+    READ_TIMEOUT_S = 30
+
+    # Connection failures are retried at a fixed interval. Requests that reached
+    # the server are never retried, so an unload is not re-triggered on 4xx/5xx.
+    MAX_CONNECT_RETRIES = 3
+    RETRY_INTERVAL_MS = 1000
+
+    # Short-lived memo of "nothing loaded" answers from /api/ps per Ollama URL.
+    # Opt-in only: another node can load a model at any time, and the cache
+    # can't see that happen.
+    _PS_TTL_S = 2.0
+    _ps_cache = {}  # ollama_url -> (timestamp, loaded models)
+
+    # One pooled session shared by every node instance, so keep-alive
+    # connections survive across workflow runs and node re-creation
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self):
         pass
 
+    @classmethod
+    def _get_session(cls):
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            requests.Session: Session with connection pooling and retry policy
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                retry = _StaticIntervalRetry(
+                    total=cls.MAX_CONNECT_RETRIES,
+                    connect=cls.MAX_CONNECT_RETRIES,
+                    read=0,
+                    status=0,
+                    backoff_factor=cls.RETRY_INTERVAL_MS / 1000,
+                    allowed_methods=frozenset(["GET", "POST"]),
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=cls.MAX_PARALLEL_UNLOADS,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._session = session
+
+            return cls._session
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -45,6 +118,10 @@ class OllamaReleaseVRAM:
                 "trigger": ("*", {
                     "tooltip": "Optional input to trigger execution after other nodes complete"
                 }),
+                "use_cached_result": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Reuse a 'nothing loaded' answer from the last few seconds instead of querying Ollama. Can miss a model loaded by another node in between, so leave off unless you know nothing else uses Ollama"
+                }),
             },
         }
 
@@ -64,101 +141,156 @@ class OllamaReleaseVRAM:
             method (str): HTTP method (GET or POST)
 
         Returns:
-            dict: Parsed JSON response
+            tuple: (parsed JSON response, number of connection retries needed)
         """
-        headers = {"Content-Type": "application/json"}
+        timeout = (self.CONNECT_TIMEOUT_S, self.READ_TIMEOUT_S)
 
         if data is not None:
-            data = json.dumps(data).encode("utf-8")
-            request = urllib.request.Request(url, data=data, headers=headers, method="POST")
+            response = self._get_session().post(url, json=data, timeout=timeout)
         else:
-            request = urllib.request.Request(url, headers=headers, method=method)
+            response = self._get_session().request(method, url, timeout=timeout)
+
+        response.raise_for_status()
 
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
+        retries = getattr(response.raw, "retries", None)
+        retry_count = len(retries.history) if retries is not None else 0
 
-    def _get_loaded_models(self, base_url):
+        return response.json(), retry_count
+
+    def _get_loaded_models(self, ps_url):
         """
         Get list of currently loaded models from Ollama.
 
         Args:
-            base_url (str): Base URL for Ollama API
+            ps_url (str): Full URL of the /api/ps endpoint
 
         Returns:
             list: List of loaded model info dictionaries
         """
-        url = f"{base_url.rstrip('/')}/api/ps"
-        response = self._api_request(url)
+        response, _ = self._api_request(ps_url)
         return response.get("models", [])
 
-    def _unload_model(self, base_url, model_name):
+    def _unload_model(self, generate_url, model_name):
         """
         Unload a specific model from Ollama's VRAM.
 
         Sends a generate request with keep_alive=0 to immediately unload the model.
 
         Args:
-            base_url (str): Base URL for Ollama API
+            generate_url (str): Full URL of the /api/generate endpoint
             model_name (str): Name of the model to unload
 
         Returns:
-            bool: True if successful
+            int: Number of connection retries needed before the request succeeded
         """
-        url = f"{base_url.rstrip('/')}/api/generate"
         data = {
             "model": model_name,
             "keep_alive": 0,  # Immediately unload the model
             "prompt": "",     # Empty prompt, we just want to trigger unload
         }
-        self._api_request(url, data=data)
-        return True
+        _, retry_count = self._api_request(generate_url, data=data)
+        return retry_count
+
+    @staticmethod
+    def _size_gb(model_info):
+        """
+        Get the VRAM size of a loaded model in gigabytes.
+
+        Args:
+            model_info (dict): Model info dictionary from /api/ps
+
+        Returns:
+            float: Model size in GB (0 if unknown)
+        """
+        model_size = model_info.get("size", 0)
+        return model_size / (1024 ** 3) if model_size else 0
 
-    def release_vram(self, ollama_url, trigger=None):
+    def release_vram(self, ollama_url, trigger=None, use_cached_result=False):
         """
         Main execution function that unloads all models from Ollama.
 
         Args:
             ollama_url (str): Base URL for Ollama API
             trigger: Optional trigger input (unused, just for workflow ordering)
+            use_cached_result (bool): Reuse a recent "nothing loaded" /api/ps answer
 
         Returns:
             tuple: Summary string of the operation
         """
         results = []
 
+        # Resolve endpoint URLs once rather than per request
+        base_url = ollama_url.rstrip("/")
+        ps_url = f"{base_url}/api/ps"
+        generate_url = f"{base_url}/api/generate"
+
         try:
-            # Get currently loaded models
-            print(f"🔍 Checking Ollama at {ollama_url} for loaded models...")
-            loaded_models = self._get_loaded_models(ollama_url)
+            # Get currently loaded models, reusing a fresh cached answer only if asked to
+            cached = self._ps_cache.get(ollama_url) if use_cached_result else None
+            from_cache = cached is not None and time.monotonic() - cached[0] < self._PS_TTL_S
+
+            if from_cache:
+                print(f"🔍 Using cached model list for {ollama_url}")
+                loaded_models = cached[1]
+            else:
+                print(f"🔍 Checking Ollama at {ollama_url} for loaded models...")
+                loaded_models = self._get_loaded_models(ps_url)
 
             if not loaded_models:
+                # Only a fresh /api/ps answer is remembered, never an assumption
+                if not from_cache:
+                    self._ps_cache[ollama_url] = (time.monotonic(), [])
                 msg = "No models currently loaded in Ollama VRAM."
                 print(f"✓ {msg}")
                 return (msg, trigger)
 
             print(f"📋 Found {len(loaded_models)} loaded model(s)")
 
-            # Unload each model
+            # Unload all models concurrently - each request blocks until Ollama
+            # has evicted that model, so running them in parallel means the
+            # total wait is the slowest unload rather than the sum of all of them
             unloaded_count = 0
             total_size = 0
 
-            for model_info in loaded_models:
-                model_name = model_info.get("name", "unknown")
-                model_size = model_info.get("size", 0)
-                size_gb = model_size / (1024 ** 3) if model_size else 0
-
-                try:
-                    print(f"🔄 Unloading: {model_name} ({size_gb:.2f} GB)...")
-                    self._unload_model(ollama_url, model_name)
-                    results.append(f"✓ Unloaded: {model_name} ({size_gb:.2f} GB)")
-                    unloaded_count += 1
-                    total_size += model_size
-                    print(f"✓ Successfully unloaded: {model_name}")
-
-                except Exception as e:
-                    error_msg = f"✗ Failed to unload {model_name}: {str(e)}"
-                    results.append(error_msg)
-                    print(f"⚠️ {error_msg}")
+            max_workers = min(len(loaded_models), self.MAX_PARALLEL_UNLOADS)
+
+            # Outcome lines indexed by model position, so the result string keeps
+            # the /api/ps order while progress is printed as each unload finishes
+            outcomes = [None] * len(loaded_models)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for index, model_info in enumerate(loaded_models):
+                    model_name = model_info.get("name", "unknown")
+                    print(f"🔄 Unloading: {model_name} ({self._size_gb(model_info):.2f} GB)...")
+                    future = executor.submit(self._unload_model, generate_url, model_name)
+                    futures[future] = index
+
+                for future in as_completed(futures):
+                    index = futures[future]
+                    model_info = loaded_models[index]
+                    model_name = model_info.get("name", "unknown")
+                    model_size = model_info.get("size", 0)
+                    size_gb = self._size_gb(model_info)
+
+                    try:
+                        retry_count = future.result()
+                        retry_note = f" after {retry_count} retry(s)" if retry_count else ""
+                        outcomes[index] = f"✓ Unloaded: {model_name} ({size_gb:.2f} GB){retry_note}"
+                        unloaded_count += 1
+                        total_size += model_size
+                        print(f"✓ Successfully unloaded: {model_name}")
+
+                    except Exception as e:
+                        error_msg = f"✗ Failed to unload {model_name}: {str(e)}"
+                        outcomes[index] = error_msg
+                        print(f"⚠️ {error_msg}")
+
+            results.extend(outcomes)
+
+            # A model may be loaded again at any moment, so an unload never
+            # produces a "nothing loaded" entry
+            self._ps_cache.pop(ollama_url, None)
 
             # Summary
             total_gb = total_size / (1024 ** 3)
@@ -168,12 +300,14 @@ class OllamaReleaseVRAM:
 
             return ("\n".join(results), trigger)
 
-        except urllib.error.URLError as e:
+        except requests.exceptions.ConnectionError as e:
+            self._ps_cache.pop(ollama_url, None)
             error_msg = f"❌ Cannot connect to Ollama at {ollama_url}: {str(e)}"
             print(error_msg)
             return (error_msg, trigger)
 
         except Exception as e:
+            self._ps_cache.pop(ollama_url, None)
             error_msg = f"❌ Error releasing Ollama VRAM: {str(e)}"
             print(error_msg)
             return (error_msg, trigger)
@@ -4,7 +4,12 @@ Audio processing nodes for ComfyUI-JSNodes
 This module contains custom nodes for audio manipulation and synchronization.
 """
 
-import torch
+import logging
+
+from .file_utils import OUTPUT_DIR, next_counter
+
+
+logger = logging.getLogger(__name__)
 
 
 class AudioPadToFrames:
@@ -15,7 +20,8 @@ class AudioPadToFrames:
     - Padding with silence if audio is too short
     - Trimming excess if audio is too long
 
-    This ensures perfect synchronization between audio and video outputs.
+    This ensures perfect synchronization between audio and video outputs. Audio
+    already within 1ms of the target length is passed through untouched.
 
     Inputs:
         audio (AUDIO): Input audio waveform
@@ -70,41 +76,59 @@ class AudioPadToFrames:
             fps (float): Video frame rate
 
         Returns:
-            tuple: Modified audio data in ComfyUI AUDIO format
+            tuple: Modified audio data in ComfyUI AUDIO format. When trimming, the
+                waveform is a view of the input tensor; when the length is already
+                within 1ms of the target, the input audio is returned unchanged.
         """
+        # Imported here so loading the node pack doesn't pay for torch up front
+        import torch
+
         waveform = audio['waveform']  # Shape: [batch, channels, samples]
         sample_rate = audio['sample_rate']
 
-        # Calculate target duration and samples needed
-        target_duration = target_frame_count / fps
-        target_samples = int(target_duration * sample_rate)
+        # Calculate samples needed for the target duration. Rounding (rather than
+        # truncating) avoids landing one sample short due to float error.
+        target_samples = int(round(target_frame_count * sample_rate / fps))
         current_samples = waveform.shape[-1]
 
+        # Differences under 1ms are inaudible and far below one video frame, so
+        # treat them as a match rather than allocating a new waveform
+        tolerance = max(1, int(sample_rate * 0.001))
+
+        if abs(current_samples - target_samples) < tolerance:
+            # Audio duration already matches - hand back the original object so
+            # downstream nodes can recognise it as unchanged
+            logger.debug("✓ Audio duration already matches target frame count")
+            return (audio,)
+
         # Determine operation needed
         if current_samples < target_samples:
             # Audio is too short - pad with silence
             pad_amount = target_samples - current_samples
-            padding = torch.zeros(
-                (waveform.shape[0], waveform.shape[1], pad_amount),
-                dtype=waveform.dtype,
-                device=waveform.device
-            )
-            new_waveform = torch.cat((waveform, padding), dim=-1)
+
+            if waveform.is_contiguous():
+                # Allocate the final shape once, then one bulk copy of the source
+                # and one memset of the tail - the minimum memory traffic
+                new_waveform = torch.empty(
+                    (*waveform.shape[:-1], target_samples),
+                    dtype=waveform.dtype,
+                    device=waveform.device
+                )
+                new_waveform[..., :current_samples].copy_(waveform)
+                new_waveform[..., current_samples:].zero_()
+            else:
+                new_waveform = torch.nn.functional.pad(waveform, (0, pad_amount))
             print(f"🔇 Audio Padding: Added {pad_amount} samples "
                   f"(~{pad_amount/sample_rate:.2f}s) of silence")
 
-        elif current_samples > target_samples:
-            # Audio is too long - trim excess
-            new_waveform = waveform[:, :, :target_samples]
+        else:
+            # Audio is too long - trim excess. narrow() returns a view that
+            # shares the input's memory, so no samples are copied.
+            new_waveform = torch.narrow(waveform, -1, 0, target_samples)
             trimmed = current_samples - target_samples
             print(f"✂️ Audio Trimming: Removed {trimmed} samples "
                   f"(~{trimmed/sample_rate:.2f}s) from end")
 
-        else:
-            # Audio duration matches perfectly
-            new_waveform = waveform
-            print("✓ Audio duration already matches target frame count")
-
         # Return in ComfyUI AUDIO format
         new_audio = {
             "waveform": new_waveform,
@@ -147,14 +171,8 @@ class SaveSRT:
     """
 
     def __init__(self):
-        # Get ComfyUI's output directory
-        try:
-            import folder_paths
-            self.output_dir = folder_paths.get_output_directory()
-        except:
-            # Fallback: use ComfyUI/output relative to current working directory
-            import os
-            self.output_dir = os.path.join(os.getcwd(), "output")
+        # ComfyUI's output directory (resolved once at import)
+        self.output_dir = OUTPUT_DIR
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -215,19 +233,16 @@ class SaveSRT:
                 actual_prefix = filename_prefix
 
             # Find next available sequential number
-            counter = 1
-            while True:
-                filename = f"{actual_prefix}_{counter:05d}.srt"
-                filepath = full_output_dir / filename
-                if not filepath.exists():
-                    break
-                counter += 1
+            counter = next_counter(full_output_dir, actual_prefix, ext="srt")
+            filename = f"{actual_prefix}_{counter:05d}.srt"
+            filepath = full_output_dir / filename
 
             print(f"📝 Output will be: {filename}")
 
-            # Save SRT content with UTF-8 encoding (critical for Chinese characters)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(srt_content)
+            # Save SRT content with UTF-8 encoding (critical for Chinese characters).
+            # Encoding once and writing bytes keeps line endings exactly as given,
+            # with no per-platform newline translation.
+            filepath.write_bytes(srt_content.encode('utf-8'))
 
             print(f"💾 Saved SRT file to: {filepath}")
 
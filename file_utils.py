@@ -0,0 +1,74 @@
+"""
+File helpers for ComfyUI-JSNodes
+
+This module contains shared helpers for the nodes that write sequentially
+numbered output files.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+
+# ComfyUI's output directory, resolved once at import
+try:
+    import folder_paths
+    OUTPUT_DIR = folder_paths.get_output_directory()
+except ImportError:
+    # Fallback: use ComfyUI/output relative to the working directory at load time
+    OUTPUT_DIR = os.path.join(os.getcwd(), "output")
+
+
+@lru_cache(maxsize=64)
+def _counter_pattern(prefix, suffix, ext):
+    """
+    Build (and cache) the regex matching numbered output files.
+
+    Matches "<prefix>_<00001>[_<batch index>][_<suffix>].<ext>" and captures the
+    sequence number: 5 digits, or more once numbering passes 99999.
+    """
+    suffix_part = f"_{re.escape(suffix)}" if suffix else ""
+    return re.compile(
+        rf"^{re.escape(prefix)}_(\d{{5,}})(?:_\d{{3}})?{suffix_part}\.{re.escape(ext)}$",
+        re.IGNORECASE,
+    )
+
+
+def next_counter(dir_path, prefix, suffix="", ext="png"):
+    """
+    Find the next free sequence number for an output file.
+
+    Reads the directory once and returns one past the highest existing number,
+    instead of probing candidate filenames one stat() call at a time.
+
+    Args:
+        dir_path (Path | str): Directory the file will be written to
+        prefix (str): Filename prefix (without subfolders)
+        suffix (str): Optional filename suffix
+        ext (str): File extension without the dot
+
+    Returns:
+        int: Next sequence number (1 if no numbered files exist yet)
+
+    Example:
+        With "image_00001.png" and "image_00004.png" present,
+        next_counter(dir, "image") returns 5.
+    """
+    pattern = _counter_pattern(prefix, suffix, ext)
+    max_seen = 0
+
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match:
+                    max_seen = max(max_seen, int(match.group(1)))
+    except FileNotFoundError:
+        # Directory doesn't exist yet, so nothing has been saved there
+        pass
+
+    return max_seen + 1
+
+
+# Export helpers from this module
+__all__ = ['OUTPUT_DIR', 'next_counter']
@@ -4,11 +4,53 @@ Image processing nodes for ComfyUI-JSNodes
 This module contains custom nodes for image manipulation and saving.
 """
 
-import torch
-import numpy as np
-from PIL import Image
 from pathlib import Path
+from functools import lru_cache
 import os
+import logging
+import concurrent.futures
+
+from .file_utils import OUTPUT_DIR, next_counter
+
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for PNG encoding - PIL releases the GIL while compressing, so a
+# batch of images can be encoded in parallel across cores
+_PNG_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+
+
+@lru_cache(maxsize=None)
+def _load_png_encoder():
+    """
+    Import the PNG encoding backend on first use.
+
+    torch/torchvision/PIL are heavy to import, so they're deferred until an image
+    is actually saved rather than loaded when ComfyUI starts.
+
+    Returns:
+        callable: torchvision's encode_png, or None to fall back to PIL
+    """
+    import PIL
+
+    # Pillow-SIMD is a drop-in replacement for Pillow (version strings like
+    # "9.0.0.post1") with vectorized conversion routines
+    pil_name = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+
+    # torchvision's libpng encoder takes uint8 tensors directly
+    try:
+        from torchvision.io import encode_png
+    except ImportError:
+        encode_png = None
+
+    # Report the backend that will actually do the encoding
+    if encode_png is not None:
+        print(f"   → Save Image Optional: encoding PNGs with torchvision "
+              f"(RGBA images with {pil_name} {PIL.__version__})")
+    else:
+        print(f"   → Save Image Optional: encoding PNGs with {pil_name} {PIL.__version__}")
+
+    return encode_png
 
 
 class SaveImageOptional:
@@ -25,6 +67,7 @@ class SaveImageOptional:
         filename_prefix (STRING): Prefix for filename, supports subfolders (e.g., "video/myvideo")
         filename_suffix (STRING): Suffix for filename (e.g., "preview")
         save_output (BOOLEAN): Whether to save the image (True) or just pass through (False)
+        compress_level (INT): PNG compression level, 0 (fastest) to 9 (smallest files)
 
     Outputs:
         image (IMAGE): The input image (passed through unchanged)
@@ -39,14 +82,8 @@ class SaveImageOptional:
     """
 
     def __init__(self):
-        # Try to get ComfyUI's output directory
-        try:
-            import folder_paths
-            self.output_dir = folder_paths.get_output_directory()
-        except:
-            # Fallback: use ComfyUI/output relative to current working directory
-            # Assumes ComfyUI structure
-            self.output_dir = os.path.join(os.getcwd(), "output")
+        # ComfyUI's output directory (resolved once at import)
+        self.output_dir = OUTPUT_DIR
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -65,6 +102,13 @@ class SaveImageOptional:
                     "default": True,
                     "tooltip": "Save the image to file (True) or just pass through (False)"
                 }),
+                "compress_level": ("INT", {
+                    "default": 1,
+                    "min": 0,
+                    "max": 9,
+                    "step": 1,
+                    "tooltip": "PNG compression level: 1 is fast for previews, 6+ gives smaller files for archiving"
+                }),
             },
         }
 
@@ -74,7 +118,8 @@ class SaveImageOptional:
     CATEGORY = "JSNodes/Image"
     OUTPUT_NODE = True
 
-    def save_image_optional(self, image, filename_prefix, filename_suffix, save_output):
+    def save_image_optional(self, image, filename_prefix, filename_suffix, save_output,
+                            compress_level=1):
         """
         Main execution function that optionally saves the image.
 
@@ -83,6 +128,7 @@ class SaveImageOptional:
             filename_prefix (str): Prefix for output filename (can include subfolder path)
             filename_suffix (str): Suffix for output filename
             save_output (bool): Whether to save the image to disk
+            compress_level (int): PNG compression level (0-9)
 
         Returns:
             tuple: The input image (passed through)
@@ -108,31 +154,43 @@ class SaveImageOptional:
                 full_output_dir = output_dir / subfolder
                 full_output_dir.mkdir(parents=True, exist_ok=True)
 
-                print(f"📁 Created/using subfolder: {subfolder}")
+                logger.debug("📁 Created/using subfolder: %s", subfolder)
             else:
                 # No subfolder, just use output directory
                 full_output_dir = output_dir
                 actual_prefix = filename_prefix
 
-            # Find next available sequential number
-            counter = 1
-            while True:
-                # Build filename with pattern: prefix_00001_suffix.png
-                if filename_suffix:
-                    filename = f"{actual_prefix}_{counter:05d}_{filename_suffix}.png"
-                else:
-                    filename = f"{actual_prefix}_{counter:05d}.png"
+            # Find next available sequential number (batch files included)
+            counter = next_counter(full_output_dir, actual_prefix, filename_suffix, "png")
+
+            # Build filename with pattern: prefix_00001_suffix.png
+            if filename_suffix:
+                filename = f"{actual_prefix}_{counter:05d}_{filename_suffix}.png"
+            else:
+                filename = f"{actual_prefix}_{counter:05d}.png"
 
-                filepath = full_output_dir / filename
-                if not filepath.exists():
-                    break
-                counter += 1
+            filepath = full_output_dir / filename
 
-            print(f"📝 Output will be: {filepath.name}")
+            logger.debug("📝 Output will be: %s", filepath.name)
+
+            import torch  # deferred until an image is actually saved
+
+            # Resolve the encoder up front, before any pool workers need it
+            _load_png_encoder()
+
+            # Convert to uint8 one image at a time into a preallocated tensor, so
+            # only one image's float32 temporary exists at a time. On CUDA the
+            # uint8 batch then crosses to host in one transfer (a quarter of the
+            # float32 bytes)
+            images_u8 = torch.empty(image.shape, dtype=torch.uint8, device=image.device)
+            for i, img in enumerate(image):
+                images_u8[i].copy_(img.mul(255).clamp_(0, 255))
+            if image.is_cuda:
+                images_u8 = images_u8.cpu()
 
             # Process and save each image in the batch
-            saved_count = 0
-            for i, img_tensor in enumerate(image):
+            futures = []
+            for i, img_u8 in enumerate(images_u8):
                 # Adjust filename for batch index if there's more than one image
                 if len(image) > 1:
                     if filename_suffix:
@@ -143,9 +201,16 @@ class SaveImageOptional:
                 else:
                     batch_filepath = filepath
 
-                # Convert tensor to PIL Image and save
-                self._save_tensor_as_png(img_tensor, batch_filepath)
-                saved_count += 1
+                # Hand the PNG encode off to the pool
+                futures.append(_PNG_POOL.submit(
+                    self._save_tensor_as_png, img_u8, batch_filepath, compress_level
+                ))
+
+            # Wait for every encode to finish and surface the first failure
+            concurrent.futures.wait(futures)
+            for future in futures:
+                future.result()
+            saved_count = len(futures)
 
             print(f"💾 Saved {saved_count} image(s) to: {full_output_dir}")
 
@@ -157,25 +222,36 @@ class SaveImageOptional:
             # Don't raise error, just pass through the image
             return (image,)
 
-    def _save_tensor_as_png(self, img_tensor, filepath):
+    def _save_tensor_as_png(self, img_tensor, filepath, compress_level=1):
         """
-        Convert a tensor to PIL Image and save as PNG.
+        Encode a uint8 image tensor and save it as PNG.
+
+        Uses torchvision's encoder when available (grayscale/RGB), otherwise PIL.
 
         Args:
-            img_tensor (torch.Tensor): Image tensor [height, width, channels]
+            img_tensor (torch.Tensor): uint8 CPU image tensor [height, width, channels]
             filepath (Path): Output file path
+            compress_level (int): PNG compression level (0-9)
         """
-        # Convert from torch tensor to numpy
-        img_np = img_tensor.cpu().numpy()
+        encode_png = _load_png_encoder()
+
+        if encode_png is not None and img_tensor.shape[-1] in (1, 3):
+            # torchvision expects channels-first [channels, height, width]
+            png_data = encode_png(
+                img_tensor.permute(2, 0, 1).contiguous(), compression_level=compress_level
+            )
+            Path(filepath).write_bytes(png_data.numpy().tobytes())
+            logger.debug("saved %s", Path(filepath).name)
+            return
 
-        # Convert from float [0, 1] to uint8 [0, 255]
-        img_np = (img_np * 255).clip(0, 255).astype(np.uint8)
+        from PIL import Image
 
-        # Create PIL Image
-        pil_image = Image.fromarray(img_np)
+        # Wrap the tensor's memory as a NumPy array (no copy) and create PIL Image
+        pil_image = Image.fromarray(img_tensor.numpy())
 
-        # Save as PNG
-        pil_image.save(filepath, format='PNG', compress_level=4)
+        # Save as PNG (single-pass compression, no Huffman optimize pass)
+        pil_image.save(filepath, format='PNG', compress_level=compress_level, optimize=False)
+        logger.debug("saved %s", Path(filepath).name)
 
 
 # Export nodes from this module
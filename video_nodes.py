@@ -4,12 +4,248 @@ Video processing nodes for ComfyUI-JSNodes
 This module contains custom nodes for video manipulation and processing.
 """
 
+import fnmatch
+import glob
 import os
 import re
 import json
+import logging
+import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from .file_utils import next_counter
+
+
+# Optional faster JSON parser; both raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+logger = logging.getLogger(__name__)
+
+# ffmpeg resolved against PATH once at import, so launches don't search PATH
+# each time (slow on Windows). Falls back to the bare name if it isn't found
+# yet, in which case it's looked up again when run.
+_FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
+
+
+# Matches the input duration ffmpeg logs to stderr, e.g. "  Duration: 00:01:23.45,"
+_DURATION_RE = re.compile(r'Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+
+# Raised when video_info matches none of the supported shapes
+_VIDEO_INFO_ERROR = "Unable to parse video_info. Expected VHS Video Combine output format."
+
+# Case variants of the .mp4 extension, for str.endswith without lowercasing
+_MP4_SUFFIXES = ('.mp4', '.MP4', '.Mp4', '.mP4')
+
+# Sequence number at the end of a video filename, e.g. "video_10.mp4" -> "10"
+_SEQ_RE = re.compile(r'_(\d+)\.mp4$', re.IGNORECASE)
+
+
+# Subtitle color mapping to ASS format (BGR format in hex)
+_COLOR_MAP = {
+    "white": "&H00FFFFFF",
+    "yellow": "&H0000FFFF",
+    "black": "&H00000000",
+    "red": "&H000000FF",
+    "green": "&H0000FF00",
+    "blue": "&H00FF0000",
+    "cyan": "&H00FFFF00",
+    "magenta": "&H00FF00FF",
+    "dark_gray": "&H00404040",
+    "none": "&H00000000"
+}
+
+# Subtitle position alignment (ASS format)
+# Alignment: 1=left, 2=center, 3=right
+# + 0=bottom, 4=middle, 8=top
+_POSITION_MAP = {
+    "bottom": 2,  # Bottom center
+    "middle": 6,  # Middle center
+    "top": 8      # Top center
+}
+
+
+def _sequence_key(path):
+    """
+    Sort key ordering videos by their numeric suffix, so "_9" comes before "_10".
+
+    Files without a numeric suffix sort first; ties fall back to the name.
+    """
+    match = _SEQ_RE.search(path.name)
+    return (int(match.group(1)) if match else -1, path.name)
+
+
+def _paths_exist(paths, max_workers=8):
+    """
+    Check several paths for existence concurrently.
+
+    Each check is a stat() call, which on network shares (SMB/NFS) is a full
+    round trip; issuing them from a few threads overlaps that latency.
+
+    Args:
+        paths (list): Paths to check
+        max_workers (int): Upper bound on concurrent checks
+
+    Returns:
+        list: One bool per path, in the same order
+    """
+    if len(paths) < 2:
+        return [os.path.exists(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(os.path.exists, paths))
+
+
+def _create_progress_bar(total):
+    """
+    Create a ComfyUI progress bar, or None when running outside ComfyUI.
+    """
+    try:
+        import comfy.utils
+        return comfy.utils.ProgressBar(total)
+    except ImportError:
+        return None
+
+
+def _output_paths(ffmpeg_cmd):
+    """
+    Return the output files of an ffmpeg command built by this module.
+
+    Every builder here puts each output file right after "-y", so those are
+    the files a killed ffmpeg may have left half-written.
+
+    Args:
+        ffmpeg_cmd (list): ffmpeg argument list
+
+    Returns:
+        list: Output file paths, in command order
+    """
+    return [ffmpeg_cmd[i + 1] for i, arg in enumerate(ffmpeg_cmd[:-1]) if arg == '-y']
+
+
+def _run_ffmpeg(ffmpeg_cmd, show_progress=True, tail_lines=200, stdin_data=None):
+    """
+    Run an ffmpeg command, streaming its output instead of buffering it.
+
+    ffmpeg's log is read line by line and only the last few lines are kept for
+    error reporting, so long encodes don't accumulate their whole log in memory.
+    Progress is requested on stdout (-progress pipe:1) and forwarded to ComfyUI's
+    progress bar as a percentage of the input duration.
+
+    Args:
+        ffmpeg_cmd (list): ffmpeg argument list (starting with the executable)
+        show_progress (bool): Report progress to ComfyUI's progress bar
+        tail_lines (int): Number of trailing log lines kept for error messages
+        stdin_data (str): Text to feed to ffmpeg's stdin (for "-i pipe:0" inputs)
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or exits with an error
+
+    If anything interrupts the run (a cancelled ComfyUI progress bar, Ctrl+C),
+    ffmpeg is killed and its partial output files are removed before the
+    exception propagates.
+    """
+    # An absolute executable path and close_fds=False let CPython launch ffmpeg
+    # with posix_spawn instead of forking ComfyUI's (multi-GB) process. Python
+    # opens files as non-inheritable, so nothing extra leaks into the child.
+    executable = ffmpeg_cmd[0]
+    if not os.path.isabs(executable):
+        executable = shutil.which(executable) or executable
+    cmd = [executable, '-progress', 'pipe:1', '-nostats', *ffmpeg_cmd[1:]]
+    if stdin_data is None:
+        # No keyboard interaction either, even if stdin were a terminal
+        cmd.insert(1, '-nostdin')
+
+    try:
+        process = subprocess.Popen(
+            cmd,
+            # Never inherit ComfyUI's stdin: on a terminal, ffmpeg would put the
+            # tty in raw mode and read keypresses as commands ("q" quits)
+            stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=(os.name != 'posix'),
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "ffmpeg not found. Please install ffmpeg and add it to your PATH."
+        )
+
+    tail = deque(maxlen=tail_lines)
+    duration_us = []
+
+    def drain_stderr():
+        # Runs on its own thread so neither pipe can fill up and stall ffmpeg
+        for line in process.stderr:
+            tail.append(line.rstrip())
+            if not duration_us:
+                match = _DURATION_RE.search(line)
+                if match:
+                    hours, minutes, seconds = match.groups()
+                    total_s = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                    duration_us.append(int(total_s * 1_000_000))
+
+    try:
+        stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_reader.start()
+
+        if stdin_data is not None:
+            def feed_stdin():
+                # Fed from a thread as well, so a large input can't deadlock
+                # against ffmpeg filling the stdout pipe
+                try:
+                    process.stdin.write(stdin_data)
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    # ffmpeg exited early; its log explains why
+                    pass
+
+            threading.Thread(target=feed_stdin, daemon=True).start()
+
+        progress_bar = _create_progress_bar(100) if show_progress else None
+
+        # Progress lines are key=value pairs, e.g. "out_time_us=1500000"
+        for line in process.stdout:
+            key, _, value = line.strip().partition('=')
+            if progress_bar is not None and key == 'out_time_us' and value.isdigit():
+                if duration_us and duration_us[0] > 0:
+                    percent = min(100, int(value) * 100 // duration_us[0])
+                    progress_bar.update_absolute(percent, 100)
+
+        process.wait()
+        stderr_reader.join()
+    except BaseException:
+        # A cancelled progress bar, Ctrl+C or any other error must not leave
+        # ffmpeg running in the background or a half-written file behind
+        process.kill()
+        process.wait()
+        for output_path in _output_paths(ffmpeg_cmd) if process.returncode else ():
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+        raise
+
+    if process.returncode != 0:
+        error_msg = "ffmpeg failed: " + "\n".join(tail)
+        print(f"❌ {error_msg}")
+        raise RuntimeError(error_msg)
+
+    if progress_bar is not None:
+        progress_bar.update_absolute(100, 100)
+
 
 class SubtitleBurnIn:
     """
@@ -36,6 +272,12 @@ class SubtitleBurnIn:
         outline_width (INT): Width of text outline (default: 2)
         position (COMBO): Vertical position of subtitles
         margin_v (INT): Vertical margin from edge in pixels
+        encoder (COMBO): Video encoder - libx264 (CPU), h264_nvenc/hevc_nvenc
+            (NVIDIA GPU) or h264_vaapi (Intel/AMD GPU on Linux)
+        mode (COMBO): "burn" draws subtitles into the picture; "soft_mux" adds
+            them as a subtitle track without re-encoding (styling is ignored)
+        quality (COMBO): Encoding speed/quality trade-off - archive, balanced
+            or fast (libx264 and NVENC)
 
     Outputs:
         output_path (STRING): Path to the generated video file
@@ -50,9 +292,55 @@ class SubtitleBurnIn:
         → Output: C:/videos/movie_subbed_00001.mp4
     """
 
+    ENCODERS = ["libx264", "h264_nvenc", "hevc_nvenc", "h264_vaapi"]
+
+    # Render node used for VAAPI hardware encoding
+    VAAPI_DEVICE = "/dev/dri/renderD128"
+
+    # burn re-encodes the video; soft_mux only adds a subtitle track
+    MODES = ["burn", "soft_mux"]
+
+    # Speed/quality trade-off per quality setting:
+    # (libx264 preset, libx264 CRF, NVENC preset, NVENC CQ)
+    QUALITY_PRESETS = {
+        "archive": ("slow", 16, "p7", 17),
+        "balanced": ("medium", 18, "p5", 19),
+        "fast": ("veryfast", 22, "p2", 23),
+    }
+
+    # Encoders supported by the local ffmpeg build (probed once, on first use)
+    _available_encoders = None
+
     def __init__(self):
         pass
 
+    @classmethod
+    def _get_available_encoders(cls):
+        """
+        Get the set of video encoders supported by the installed ffmpeg.
+
+        Runs `ffmpeg -encoders` once and caches the result on the class.
+
+        Returns:
+            set: Encoder names (empty if ffmpeg couldn't be queried)
+        """
+        if cls._available_encoders is None:
+            try:
+                result = subprocess.run(
+                    [_FFMPEG, '-hide_banner', '-encoders'],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                # Lines look like: " V....D h264_nvenc    NVIDIA NVENC H.264 encoder"
+                cls._available_encoders = set(
+                    re.findall(r'^\s*V\S*\s+(\w+)', result.stdout, re.MULTILINE)
+                )
+            except (OSError, subprocess.SubprocessError):
+                cls._available_encoders = set()
+
+        return cls._available_encoders
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -105,6 +393,18 @@ class SubtitleBurnIn:
                     "step": 5,
                     "tooltip": "Vertical margin from edge in pixels"
                 }),
+                "encoder": (cls.ENCODERS, {
+                    "default": "libx264",
+                    "tooltip": "Video encoder: libx264 (CPU), *_nvenc (NVIDIA GPU) or h264_vaapi (Intel/AMD GPU on Linux)"
+                }),
+                "mode": (cls.MODES, {
+                    "default": "burn",
+                    "tooltip": "burn: draw subtitles into the picture (re-encodes). soft_mux: add them as a toggleable subtitle track (no re-encode, styling ignored)"
+                }),
+                "quality": (list(cls.QUALITY_PRESETS), {
+                    "default": "balanced",
+                    "tooltip": "Encoding speed/quality trade-off: archive (slowest, best), balanced (visually lossless) or fast"
+                }),
             },
         }
 
@@ -116,7 +416,8 @@ class SubtitleBurnIn:
 
     def burn_subtitles(self, video_path, subtitle_path, filename_prefix,
                       font_size, font_color, outline_color, outline_width,
-                      position, margin_v):
+                      position, margin_v, encoder="libx264", mode="burn",
+                      quality="balanced"):
         """
         Main execution function that burns subtitles into video.
 
@@ -130,6 +431,9 @@ class SubtitleBurnIn:
             outline_width (int): Width of text outline
             position (str): Position of subtitles (bottom/top/middle)
             margin_v (int): Vertical margin from edge
+            encoder (str): Video encoder to use
+            mode (str): "burn" to re-encode with subtitles, "soft_mux" to add a subtitle track
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
 
         Returns:
             tuple: Path to the output video file
@@ -144,27 +448,31 @@ class SubtitleBurnIn:
             video_file = Path(video_path)
             subtitle_file = Path(subtitle_path)
 
-            if not video_file.exists():
+            video_exists, subtitle_exists = _paths_exist([video_file, subtitle_file])
+            if not video_exists:
                 raise ValueError(f"Video file not found: {video_path}")
-            if not subtitle_file.exists():
+            if not subtitle_exists:
                 raise ValueError(f"Subtitle file not found: {subtitle_path}")
 
-            print(f"🎬 Input video: {video_file.name}")
-            print(f"📄 Subtitle file: {subtitle_file.name}")
+            logger.debug("🎬 Input video: %s", video_file.name)
+            logger.debug("📄 Subtitle file: %s", subtitle_file.name)
 
             # Get output directory (same as input video)
             output_dir = video_file.parent
 
             # Find next available sequential number
-            counter = 1
-            while True:
-                output_filename = f"{filename_prefix}_{counter:05d}.mp4"
-                output_path = output_dir / output_filename
-                if not output_path.exists():
-                    break
-                counter += 1
+            counter = self._find_next_counter(output_dir, filename_prefix)
+            output_filename = f"{filename_prefix}_{counter:05d}.mp4"
+            output_path = output_dir / output_filename
 
-            print(f"📝 Output will be: {output_filename}")
+            logger.debug("📝 Output will be: %s", output_filename)
+
+            if mode == "soft_mux":
+                # Pure remux: no pixel work, so it's limited by disk speed only
+                logger.debug("🎥 Running ffmpeg to add subtitle track (no re-encode)...")
+                _run_ffmpeg(self._build_soft_mux_command(video_file, subtitle_file, output_path))
+                print(f"✅ Subtitle track added: {output_path}")
+                return (str(output_path),)
 
             # Burn subtitles using ffmpeg
             self._burn_subtitles_ffmpeg(
@@ -176,7 +484,9 @@ class SubtitleBurnIn:
                 outline_color,
                 outline_width,
                 position,
-                margin_v
+                margin_v,
+                encoder,
+                quality
             )
 
             print(f"✅ Subtitle burn-in completed: {output_path}")
@@ -187,105 +497,491 @@ class SubtitleBurnIn:
             print(error_msg)
             raise RuntimeError(error_msg)
 
-    def _burn_subtitles_ffmpeg(self, video_file, subtitle_file, output_path,
-                               font_size, font_color, outline_color, outline_width,
-                               position, margin_v):
+    def _find_next_counter(self, output_dir, prefix, start=1):
         """
-        Use ffmpeg to burn subtitles into video.
+        Find the next unused sequential number for an output video.
+
+        Scans the directory once and returns one past the highest existing
+        number (or start, if that's higher).
+
+        Args:
+            output_dir (Path): Directory the video will be written to
+            prefix (str): Output filename prefix
+            start (int): Lowest number to return
+
+        Returns:
+            int: Sequence number whose "<prefix>_<number>.mp4" doesn't exist yet
+        """
+        return max(start, next_counter(output_dir, prefix, ext="mp4"))
+
+    def _resolve_encoder(self, encoder):
+        """
+        Check that the requested encoder is available, falling back to libx264.
+
+        Args:
+            encoder (str): Requested video encoder
+
+        Returns:
+            str: Encoder to actually use
+        """
+        if encoder != "libx264" and encoder not in self._get_available_encoders():
+            print(f"⚠️ Encoder {encoder} not supported by this ffmpeg build, using libx264")
+            return "libx264"
+        return encoder
+
+    def _build_subtitle_filter(self, subtitle_file, font_size, font_color,
+                               outline_color, outline_width, position, margin_v):
+        """
+        Build the ffmpeg subtitles filter that draws a styled SRT onto video.
 
         Args:
-            video_file (Path): Input video file
             subtitle_file (Path): Subtitle file
-            output_path (Path): Output video file
             font_size (int): Font size
             font_color (str): Font color
             outline_color (str): Outline color
             outline_width (int): Outline width
             position (str): Position (bottom/top/middle)
             margin_v (int): Vertical margin
-        """
-        # Color mapping to ASS format (BGR format in hex)
-        color_map = {
-            "white": "&H00FFFFFF",
-            "yellow": "&H0000FFFF",
-            "black": "&H00000000",
-            "red": "&H000000FF",
-            "green": "&H0000FF00",
-            "blue": "&H00FF0000",
-            "cyan": "&H00FFFF00",
-            "magenta": "&H00FF00FF",
-            "dark_gray": "&H00404040",
-            "none": "&H00000000"
-        }
-
-        # Position alignment (ASS format)
-        # Alignment: 1=left, 2=center, 3=right
-        # + 0=bottom, 4=middle, 8=top
-        position_map = {
-            "bottom": 2,  # Bottom center
-            "middle": 6,  # Middle center
-            "top": 8      # Top center
-        }
 
+        Returns:
+            str: Filter expression, usable in -vf or -filter_complex
+        """
         # Build subtitle style string
-        primary_color = color_map.get(font_color, "&H00FFFFFF")
-        outline_col = color_map.get(outline_color, "&H00000000")
-        alignment = position_map.get(position, 2)
+        primary_color = _COLOR_MAP.get(font_color, "&H00FFFFFF")
+        outline_col = _COLOR_MAP.get(outline_color, "&H00000000")
+        alignment = _POSITION_MAP.get(position, 2)
 
         # Escape special characters for Windows paths in ffmpeg filter
         subtitle_path_escaped = str(subtitle_file.absolute()).replace('\\', '/').replace(':', '\\:')
 
-        # Build force_style parameters
-        style_params = [
-            f"FontSize={font_size}",
-            f"PrimaryColour={primary_color}",
-            f"OutlineColour={outline_col}",
-            f"Outline={outline_width}",
-            f"Alignment={alignment}",
-            f"MarginV={margin_v}",
-            "Bold=0",
-            "BorderStyle=1"  # Outline + shadow
+        # Build force_style parameters (BorderStyle=1: outline + shadow)
+        force_style = (
+            f"FontSize={font_size},PrimaryColour={primary_color},"
+            f"OutlineColour={outline_col},Outline={outline_width},"
+            f"Alignment={alignment},MarginV={margin_v},Bold=0,BorderStyle=1"
+        )
+
+        # Use subtitles filter to burn in srt file
+        return f"subtitles='{subtitle_path_escaped}':force_style='{force_style}'"
+
+    def _encoder_args(self, encoder, quality="balanced"):
+        """
+        Get the ffmpeg arguments needed to encode with a given encoder.
+
+        Args:
+            encoder (str): Video encoder to use (must be available)
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
+
+        Returns:
+            tuple: (global args placed before the inputs,
+                    filter suffix appended after the subtitles filter,
+                    per-output codec args)
+        """
+        x264_preset, crf, nvenc_preset, cq = self.QUALITY_PRESETS.get(
+            quality, self.QUALITY_PRESETS["balanced"]
+        )
+
+        if encoder.endswith("_nvenc"):
+            # NVENC runs on the GPU's dedicated encoder; constant-quality VBR
+            # at a level comparable to libx264 at the same quality setting
+            return [], "", [
+                '-c:v', encoder,
+                '-preset', nvenc_preset,
+                '-tune', 'hq',
+                '-rc', 'vbr',
+                '-cq', str(cq),
+                '-b:v', '0',
+            ]
+
+        if encoder == "h264_vaapi":
+            # Subtitles are drawn in software, then frames are uploaded to the GPU
+            return ['-vaapi_device', self.VAAPI_DEVICE], ",format=nv12,hwupload", [
+                '-c:v', 'h264_vaapi',
+            ]
+
+        return [], "", [
+            '-c:v', 'libx264',           # Use H.264 codec
+            '-crf', str(crf),             # Quality (lower = better, 18 = visually lossless)
+            '-preset', x264_preset,       # Encoding speed/quality balance
         ]
 
-        force_style = ",".join(style_params)
+    def _build_burn_command(self, video_file, subtitle_file, output_path,
+                            font_size, font_color, outline_color, outline_width,
+                            position, margin_v, encoder="libx264", quality="balanced"):
+        """
+        Build the ffmpeg command that burns subtitles into a video.
+
+        Args:
+            video_file (Path): Input video file
+            subtitle_file (Path): Subtitle file
+            output_path (Path): Output video file
+            font_size (int): Font size
+            font_color (str): Font color
+            outline_color (str): Outline color
+            outline_width (int): Outline width
+            position (str): Position (bottom/top/middle)
+            margin_v (int): Vertical margin
+            encoder (str): Video encoder to use (must be available)
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
+
+        Returns:
+            list: ffmpeg argument list
+        """
+        video_filter = self._build_subtitle_filter(
+            subtitle_file, font_size, font_color, outline_color,
+            outline_width, position, margin_v
+        )
+        input_args, filter_suffix, codec_args = self._encoder_args(encoder, quality)
 
         # Build ffmpeg command
-        # Use subtitles filter to burn in srt file
         ffmpeg_cmd = [
-            'ffmpeg',
+            _FFMPEG,
+            *input_args,
             '-i', str(video_file),
-            '-vf', f"subtitles='{subtitle_path_escaped}':force_style='{force_style}'",
-            '-c:v', 'libx264',           # Use H.264 codec
-            '-crf', '18',                 # High quality (lower = better, 18 = visually lossless)
-            '-preset', 'medium',          # Encoding speed/quality balance
+            '-vf', video_filter + filter_suffix,
+            *codec_args,
             '-c:a', 'copy',               # Copy audio without re-encoding
             '-y',                         # Overwrite output file
             str(output_path)
         ]
 
-        print(f"🎨 Font: {font_size}pt {font_color} with {outline_color} outline")
-        print(f"📍 Position: {position} (margin: {margin_v}px)")
-        print(f"🎥 Running ffmpeg to burn subtitles...")
+        return ffmpeg_cmd
 
-        try:
-            # Run ffmpeg
-            result = subprocess.run(
-                ffmpeg_cmd,
-                capture_output=True,
-                text=True,
-                check=True
+    def _build_soft_mux_command(self, video_file, subtitle_file, output_path):
+        """
+        Build the ffmpeg command that adds subtitles as a soft track.
+
+        Audio and video are stream-copied and the SRT is converted to MP4's
+        mov_text format, so players can toggle the subtitles on and off.
+
+        Args:
+            video_file (Path): Input video file
+            subtitle_file (Path): Subtitle file
+            output_path (Path): Output video file
+
+        Returns:
+            list: ffmpeg argument list
+        """
+        return [
+            _FFMPEG,
+            '-i', str(video_file),
+            '-i', str(subtitle_file),
+            '-c', 'copy',                 # Copy audio and video without re-encoding
+            '-c:s', 'mov_text',           # MP4-compatible subtitle track
+            '-metadata:s:s:0', 'language=eng',
+            '-y',                         # Overwrite output file
+            str(output_path)
+        ]
+
+    def _burn_subtitles_ffmpeg(self, video_file, subtitle_file, output_path,
+                               font_size, font_color, outline_color, outline_width,
+                               position, margin_v, encoder="libx264", quality="balanced"):
+        """
+        Use ffmpeg to burn subtitles into video.
+
+        Args:
+            video_file (Path): Input video file
+            subtitle_file (Path): Subtitle file
+            output_path (Path): Output video file
+            font_size (int): Font size
+            font_color (str): Font color
+            outline_color (str): Outline color
+            outline_width (int): Outline width
+            position (str): Position (bottom/top/middle)
+            margin_v (int): Vertical margin
+            encoder (str): Video encoder to use
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
+        """
+        encoder = self._resolve_encoder(encoder)
+
+        ffmpeg_cmd = self._build_burn_command(
+            video_file, subtitle_file, output_path,
+            font_size, font_color, outline_color, outline_width,
+            position, margin_v, encoder, quality
+        )
+
+        logger.debug("🎨 Font: %spt %s with %s outline", font_size, font_color, outline_color)
+        logger.debug("📍 Position: %s (margin: %spx)", position, margin_v)
+        logger.debug("⚙️ Encoder: %s (%s)", encoder, quality)
+        logger.debug("🎥 Running ffmpeg to burn subtitles...")
+
+        _run_ffmpeg(ffmpeg_cmd)
+
+        logger.debug("✅ ffmpeg completed successfully")
+
+
+class BatchSubtitleBurnIn(SubtitleBurnIn):
+    """
+    Batch Subtitle Burn-In Node
+
+    Burns subtitles into several videos at once, running multiple ffmpeg
+    processes in parallel with the same styling options as Subtitle Burn-In.
+
+    A single ffmpeg encode rarely saturates a modern machine, so running a few
+    side by side finishes a batch much sooner than one after another.
+
+    Inputs:
+        video_paths (STRING): Input video files, one path per line
+        subtitle_paths (STRING): Subtitle files, one per line, matching video_paths
+        parallelism (INT): Number of ffmpeg processes to run at once (0 = auto)
+        single_process (BOOLEAN): Burn up to `parallelism` videos per ffmpeg process
+        (plus all styling and encoder inputs of Subtitle Burn-In)
+
+    Outputs:
+        output_paths (STRING): Paths of the generated videos, one per line
+
+    Example:
+        video_paths:    C:/videos/a.mp4
+                        C:/videos/b.mp4
+        subtitle_paths: C:/videos/a.srt
+                        C:/videos/b.srt
+        → Output: C:/videos/subtitled_00001.mp4
+                  C:/videos/subtitled_00002.mp4
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        single = super().INPUT_TYPES()["required"]
+        styling = {
+            name: spec for name, spec in single.items()
+            if name not in ("video_path", "subtitle_path")
+        }
+
+        return {
+            "required": {
+                "video_paths": ("STRING", {
+                    "default": "",
+                    "multiline": True,
+                    "tooltip": "Input video files (.mp4), one path per line"
+                }),
+                "subtitle_paths": ("STRING", {
+                    "default": "",
+                    "multiline": True,
+                    "tooltip": "Subtitle files (.srt), one per line in the same order as the videos"
+                }),
+                **styling,
+                "parallelism": ("INT", {
+                    "default": 0,
+                    "min": 0,
+                    "max": 32,
+                    "step": 1,
+                    "tooltip": "Number of ffmpeg processes to run at once (0 = auto: 2 for GPU encoders, a quarter of CPU cores for libx264)"
+                }),
+                "single_process": ("BOOLEAN", {
+                    "default": False,
+                    "tooltip": "Burn videos in groups of `parallelism` per ffmpeg process, one output per video. Saves process start-up, but each video still gets its own decoder and encoder instance (e.g. NVENC session). If any video in a group fails, the batch fails"
+                }),
+            },
+        }
+
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("output_paths",)
+    FUNCTION = "burn_batch"
+    CATEGORY = "JSNodes/Video"
+    OUTPUT_NODE = True
+
+    def _default_parallelism(self, encoder):
+        """
+        Pick how many ffmpeg processes to run at once for an encoder.
+
+        Consumer GPUs only run a couple of hardware encode sessions efficiently,
+        while libx264 is already multi-threaded, so only a few jobs are run side
+        by side and never more than there are cores.
+
+        Args:
+            encoder (str): Video encoder in use
+
+        Returns:
+            int: Number of parallel jobs
+        """
+        if encoder != "libx264":
+            return 2
+        return max(1, (os.cpu_count() or 1) // 4)
+
+    def _build_multi_burn_command(self, jobs, font_size, font_color, outline_color,
+                                  outline_width, position, margin_v, encoder="libx264",
+                                  quality="balanced"):
+        """
+        Build one ffmpeg command that burns subtitles into several videos.
+
+        Every video becomes an input with its own subtitles filter chain in
+        -filter_complex, and each chain is mapped (with that input's audio, if
+        any) to its own output file.
+
+        Args:
+            jobs (list): (video_file, subtitle_file, output_path) tuples
+            font_size (int): Font size
+            font_color (str): Font color
+            outline_color (str): Outline color
+            outline_width (int): Outline width
+            position (str): Position (bottom/top/middle)
+            margin_v (int): Vertical margin
+            encoder (str): Video encoder to use (must be available)
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
+
+        Returns:
+            list: ffmpeg argument list
+        """
+        input_args, filter_suffix, codec_args = self._encoder_args(encoder, quality)
+
+        ffmpeg_cmd = [_FFMPEG, *input_args]
+        for video_file, _, _ in jobs:
+            ffmpeg_cmd += ['-i', str(video_file)]
+
+        chains = []
+        for index, (_, subtitle_file, _) in enumerate(jobs):
+            video_filter = self._build_subtitle_filter(
+                subtitle_file, font_size, font_color, outline_color,
+                outline_width, position, margin_v
             )
+            chains.append(f"[{index}:v]{video_filter}{filter_suffix}[v{index}]")
+        ffmpeg_cmd += ['-filter_complex', ";".join(chains)]
+
+        for index, (_, _, output_path) in enumerate(jobs):
+            ffmpeg_cmd += [
+                '-map', f'[v{index}]',
+                '-map', f'{index}:a?',        # Audio if the input has any
+                *codec_args,
+                '-c:a', 'copy',               # Copy audio without re-encoding
+                '-y',                         # Overwrite output file
+                str(output_path)
+            ]
+
+        return ffmpeg_cmd
+
+    def burn_batch(self, video_paths, subtitle_paths, filename_prefix,
+                   font_size, font_color, outline_color, outline_width,
+                   position, margin_v, encoder="libx264", mode="burn",
+                   quality="balanced", parallelism=0, single_process=False):
+        """
+        Main execution function that burns subtitles into a batch of videos.
+
+        Args:
+            video_paths (str): Newline-separated input video paths
+            subtitle_paths (str): Newline-separated subtitle paths
+            filename_prefix (str): Prefix for output filenames
+            font_size (int): Font size for subtitles
+            font_color (str): Color of subtitle text
+            outline_color (str): Color of text outline
+            outline_width (int): Width of text outline
+            position (str): Position of subtitles (bottom/top/middle)
+            margin_v (int): Vertical margin from edge
+            encoder (str): Video encoder to use
+            mode (str): "burn" to re-encode with subtitles, "soft_mux" to add a subtitle track
+            quality (str): Encoding speed/quality trade-off (archive/balanced/fast)
+            parallelism (int): Number of ffmpeg processes to run at once (0 = auto)
+            single_process (bool): Burn videos in groups of `parallelism` per ffmpeg
+                process (burn mode only)
 
-            print(f"✅ ffmpeg completed successfully")
+        Returns:
+            tuple: Newline-separated paths of the output videos
+        """
+        try:
+            # Clean up paths - skip blank lines and strip quotes added by
+            # Windows Explorer's "Copy as path"
+            videos = [Path(line.strip().strip('"')) for line in video_paths.splitlines() if line.strip()]
+            subtitles = [Path(line.strip().strip('"')) for line in subtitle_paths.splitlines() if line.strip()]
+
+            if not videos:
+                raise ValueError("No video paths given")
+            if len(videos) != len(subtitles):
+                raise ValueError(
+                    f"Got {len(videos)} video(s) but {len(subtitles)} subtitle file(s)"
+                )
+
+            exists = _paths_exist(videos + subtitles)
+            for video_file, video_exists in zip(videos, exists[:len(videos)]):
+                if not video_exists:
+                    raise ValueError(f"Video file not found: {video_file}")
+            for subtitle_file, subtitle_exists in zip(subtitles, exists[len(videos):]):
+                if not subtitle_exists:
+                    raise ValueError(f"Subtitle file not found: {subtitle_file}")
+
+            if mode != "soft_mux":
+                encoder = self._resolve_encoder(encoder)
+
+            # Reserve a distinct output number for every video, tracking the next
+            # free number per directory so jobs in the same folder don't collide
+            next_free = {}
+            commands = []
+            output_paths = []
+
+            for video_file, subtitle_file in zip(videos, subtitles):
+                output_dir = video_file.parent
+                counter = self._find_next_counter(
+                    output_dir, filename_prefix, next_free.get(output_dir, 1)
+                )
+                next_free[output_dir] = counter + 1
+
+                output_path = output_dir / f"{filename_prefix}_{counter:05d}.mp4"
+                output_paths.append(output_path)
+                if mode == "soft_mux":
+                    commands.append(self._build_soft_mux_command(
+                        video_file, subtitle_file, output_path
+                    ))
+                else:
+                    commands.append(self._build_burn_command(
+                        video_file, subtitle_file, output_path,
+                        font_size, font_color, outline_color, outline_width,
+                        position, margin_v, encoder, quality
+                    ))
+
+            if single_process and mode != "soft_mux":
+                # One ffmpeg with a filter chain and output per video saves the
+                # process spawns, but it still opens a decoder, libass renderer and
+                # encoder per video at once. Groups are capped at `parallelism` so
+                # GPU encoders stay within their concurrent session limit.
+                group_size = max(1, parallelism or self._default_parallelism(encoder))
+                jobs = list(zip(videos, subtitles, output_paths))
+                logger.debug("🎥 Burning subtitles into %d video(s), up to %d per "
+                             "ffmpeg process (%s)...", len(jobs), group_size, encoder)
+                for start in range(0, len(jobs), group_size):
+                    _run_ffmpeg(self._build_multi_burn_command(
+                        jobs[start:start + group_size],
+                        font_size, font_color, outline_color, outline_width,
+                        position, margin_v, encoder, quality
+                    ), show_progress=False)
+
+                for video_file, output_path in zip(videos, output_paths):
+                    logger.debug("✅ %s → %s", video_file.name, output_path.name)
+                print(f"✅ Batch subtitle burn-in completed: {len(output_paths)} video(s)")
+                return ("\n".join(str(p) for p in output_paths),)
+
+            workers = parallelism or self._default_parallelism(encoder)
+            workers = max(1, min(workers, len(commands), os.cpu_count() or 1))
+
+            method = "soft_mux, no re-encode" if mode == "soft_mux" else encoder
+            logger.debug("🎥 Adding subtitles to %d video(s) with %d parallel "
+                         "ffmpeg process(es) (%s)...", len(commands), workers, method)
+
+            # Each job is its own ffmpeg process, so threads only wait on them.
+            # Per-job progress bars would fight over one node, so they're off.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_ffmpeg, cmd, show_progress=False)
+                    for cmd in commands
+                ]
+
+            failures = []
+            for video_file, output_path, future in zip(videos, output_paths, futures):
+                try:
+                    future.result()
+                    logger.debug("✅ %s → %s", video_file.name, output_path.name)
+                except RuntimeError as e:
+                    failures.append(f"{video_file.name}: {e}")
+
+            if failures:
+                raise RuntimeError(
+                    f"{len(failures)} of {len(commands)} burn(s) failed:\n" + "\n".join(failures)
+                )
+
+            print(f"✅ Batch subtitle burn-in completed: {len(output_paths)} video(s)")
+            return ("\n".join(str(p) for p in output_paths),)
 
-        except subprocess.CalledProcessError as e:
-            error_msg = f"ffmpeg failed: {e.stderr}"
-            print(f"❌ {error_msg}")
+        except Exception as e:
+            error_msg = f"❌ Error during batch subtitle burn-in: {str(e)}"
+            print(error_msg)
             raise RuntimeError(error_msg)
-        except FileNotFoundError:
-            raise RuntimeError(
-                "ffmpeg not found. Please install ffmpeg and add it to your PATH."
-            )
 
 
 class VideoStitching:
@@ -354,14 +1050,16 @@ class VideoStitching:
                 print("⏭️ Skipping video stitching (video not persisted or only in temp folder)")
                 return ("",)  # Return empty string to indicate skip
 
-            print(f"📹 Source video: {video_path}")
+            logger.debug("📹 Source video: %s", video_path)
 
             # Extract directory and filename pattern
             video_file = Path(video_path)
-            video_dir = video_file.parent
+            # Made absolute once here, so every clip path scandir returns from
+            # it is already absolute and can go into the concat list as-is
+            video_dir = Path(os.path.abspath(video_file.parent))
             file_pattern = self._extract_prefix_pattern(video_file.name)
 
-            print(f"🔍 Searching for pattern: {file_pattern}* in {video_dir}")
+            logger.debug("🔍 Searching for pattern: %s* in %s", file_pattern, video_dir)
 
             # Find all videos with the same prefix
             video_files = self._find_matching_videos(video_dir, file_pattern)
@@ -370,16 +1068,24 @@ class VideoStitching:
                 print("⚠️ No matching videos found, returning original video")
                 return (str(video_path),)
 
-            print(f"✅ Found {len(video_files)} video(s) to stitch:")
+            logger.debug("✅ Found %d video(s) to stitch:", len(video_files))
             for vf in video_files:
-                print(f"   - {vf.name}")
-
-            # Stitch videos using ffmpeg
-            output_path = self._stitch_with_ffmpeg(
-                video_files,
-                video_dir,
-                output_prefix
-            )
+                logger.debug("   - %s", vf.name)
+
+            if len(video_files) == 1:
+                # Nothing to join: a remux would just copy every byte
+                output_path = self._link_single_video(
+                    video_files[0],
+                    video_dir,
+                    output_prefix
+                )
+            else:
+                # Stitch videos using ffmpeg
+                output_path = self._stitch_with_ffmpeg(
+                    video_files,
+                    video_dir,
+                    output_prefix
+                )
 
             print(f"🎬 Stitched video created: {output_path}")
             return (str(output_path),)
@@ -402,70 +1108,177 @@ class VideoStitching:
             ]
         )
 
+        The input is dispatched on its exact type through _VIDEO_INFO_PARSERS;
+        subclasses (e.g. named tuples) fall back to isinstance checks.
+
         Args:
             video_info: Can be a tuple/list (direct from VHS) or JSON string
 
         Returns:
             str: Video file path, or None if video not persisted
         """
-        # DEBUG: Print what we actually received
-        print(f"🔍 DEBUG: video_info type = {type(video_info)}")
-        print(f"🔍 DEBUG: video_info value = {video_info}")
-
-        data = video_info
+        # Log what we actually received
+        logger.debug("🔍 video_info type = %s", type(video_info))
+        logger.debug("🔍 video_info value = %s", video_info)
 
-        # If it's a string, try to parse as JSON
+        # If it's a string, try to parse as JSON (VHS_FILENAMES normally
+        # arrives as a tuple straight from the graph and skips this)
         if isinstance(video_info, str):
-            try:
-                data = json.loads(video_info)
-            except json.JSONDecodeError:
-                # If not JSON, assume it's a direct file path
-                video_info = video_info.strip()
-                if video_info:
-                    print(f"✓ Using direct path: {video_info}")
-                    return video_info
-                raise ValueError("Unable to parse video_info")
-
-        # Handle VHS Video Combine format: (bool, [png_path, mp4_path])
-        if isinstance(data, (list, tuple)) and len(data) >= 2:
+            return self._parse_video_info_str(video_info)
+
+        return self._parse_video_info_data(video_info)
+
+    def _parse_video_info_str(self, video_info):
+        """
+        Parse video info given as JSON text or as a plain file path.
+
+        Text that decodes as JSON is handed on to _parse_video_info_data;
+        anything else is treated as a direct path to the video.
+
+        Examples:
+            '[true, ["C:/out/video_00003.png", "C:/out/video_00003.mp4"]]'
+                -> "C:/out/video_00003.mp4"
+            "C:/out/video_00003.mp4" -> "C:/out/video_00003.mp4"
+
+        Args:
+            video_info (str): JSON text or a file path
+
+        Returns:
+            str: Video file path, or None if the decoded VHS output wasn't persisted
+
+        Raises:
+            ValueError: If the text is blank, or the decoded JSON isn't a
+                supported shape (_VIDEO_INFO_ERROR)
+        """
+        try:
+            data = _json_loads(video_info)
+        except ValueError:
+            # If not JSON, assume it's a direct file path
+            video_info = video_info.strip()
+            if video_info:
+                logger.debug("✓ Using direct path: %s", video_info)
+                return video_info
+            raise ValueError("Unable to parse video_info")
+
+        return self._parse_video_info_data(data)
+
+    def _parse_video_info_data(self, data):
+        """
+        Dispatch already-decoded video info (sequence or dict) to its parser.
+
+        The parser is looked up by exact type in _VIDEO_INFO_PARSERS; subclasses
+        such as named tuples fall back to isinstance checks.
+
+        Args:
+            data: Decoded video info (tuple/list from VHS, or a dict)
+
+        Returns:
+            str: Video file path, or None if the VHS output wasn't persisted
+
+        Raises:
+            ValueError: If data isn't a supported shape (_VIDEO_INFO_ERROR)
+        """
+        parser = self._VIDEO_INFO_PARSERS.get(type(data))
+        if parser is None:
+            # Subclasses of the supported types, e.g. named tuples
+            if isinstance(data, (list, tuple)):
+                parser = VideoStitching._parse_video_info_sequence
+            elif isinstance(data, dict):
+                parser = VideoStitching._parse_video_info_dict
+
+        if parser is None:
+            raise ValueError(_VIDEO_INFO_ERROR)
+        return parser(self, data)
+
+    def _parse_video_info_sequence(self, data):
+        """
+        Parse the VHS Video Combine format: (bool, [png_path, mp4_path]).
+
+        Also accepts a one-item list holding just the video path.
+
+        Examples:
+            (True, ["C:/out/video_00003.png", "C:/out/video_00003.mp4"])
+                -> "C:/out/video_00003.mp4"
+            (False, [...]) -> None (only written to the temp folder)
+            ["C:/out/video_00003.mp4"] -> "C:/out/video_00003.mp4"
+
+        Args:
+            data (tuple | list): VHS_FILENAMES value
+
+        Returns:
+            str: The first .mp4 path (or the last entry if there is none), or
+                None if the persistence flag is False
+
+        Raises:
+            ValueError: If the sequence has no usable file list (_VIDEO_INFO_ERROR)
+        """
+        if len(data) >= 2:
             # Check if first element is a boolean indicating persistence
             if isinstance(data[0], bool):
                 if not data[0]:
                     # Video not persisted (only in temp folder), skip stitching
-                    print("⚠️ Video not persisted (temporary file), skipping stitching")
+                    logger.debug("⚠️ Video not persisted (temporary file), skipping stitching")
                     return None
                 else:
-                    print("✓ Video is persisted, proceeding with stitching")
+                    logger.debug("✓ Video is persisted, proceeding with stitching")
 
             # Second element should be array of file paths
             if isinstance(data[1], (list, tuple)) and len(data[1]) >= 2:
                 # Find the .mp4 file (should be second item)
                 for file_path in data[1]:
-                    if isinstance(file_path, str) and file_path.lower().endswith('.mp4'):
-                        print(f"✓ Parsed VHS output, found MP4: {file_path}")
+                    if isinstance(file_path, str) and file_path.endswith(_MP4_SUFFIXES):
+                        logger.debug("✓ Parsed VHS output, found MP4: %s", file_path)
                         return file_path
                 # If no .mp4 found, take the last item
                 return data[1][-1]
 
-        # Handle dict format (legacy or other sources)
-        elif isinstance(data, dict):
-            path = data.get('filename') or data.get('path')
-            if path:
-                print(f"✓ Extracted from dict: {path}")
-                return path
-
         # Handle simple string in array
         elif isinstance(data, list) and len(data) > 0:
             path = str(data[0])
-            print(f"✓ Extracted from list: {path}")
+            logger.debug("✓ Extracted from list: %s", path)
             return path
 
-        raise ValueError("Unable to parse video_info. Expected VHS Video Combine output format.")
+        raise ValueError(_VIDEO_INFO_ERROR)
+
+    def _parse_video_info_dict(self, data):
+        """
+        Parse the dict format (legacy or other sources).
+
+        Example:
+            {"filename": "C:/out/video_00003.mp4"} -> "C:/out/video_00003.mp4"
+
+        Args:
+            data (dict): Mapping with a "filename" or "path" key
+
+        Returns:
+            str: Video file path
 
-    def _extract_prefix_pattern(self, filename):
+        Raises:
+            ValueError: If neither key holds a path (_VIDEO_INFO_ERROR)
+        """
+        path = data.get('filename') or data.get('path')
+        if path:
+            logger.debug("✓ Extracted from dict: %s", path)
+            return path
+        raise ValueError(_VIDEO_INFO_ERROR)
+
+    # Video info parsers keyed by exact type: one dict lookup instead of a
+    # chain of isinstance checks for the common shapes
+    _VIDEO_INFO_PARSERS = {
+        tuple: _parse_video_info_sequence,
+        list: _parse_video_info_sequence,
+        dict: _parse_video_info_dict,
+    }
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_prefix_pattern(filename):
         """
         Extract the prefix pattern from a filename.
 
+        Results are cached per filename, since re-running a workflow keeps
+        stitching from the same few VHS outputs.
+
         Examples:
             "video_00003.mp4" -> "video"
             "output_0001.mp4" -> "output"
@@ -477,15 +1290,16 @@ class VideoStitching:
         Returns:
             str: Extracted prefix
         """
-        # Remove extension
-        name_without_ext = os.path.splitext(filename)[0]
+        # Remove extension (rpartition is a single string split, unlike splitext)
+        name_without_ext = filename.rpartition('.')[0] or filename
 
         # Match pattern: prefix followed by underscore and numbers
-        # e.g., "video_00003" -> "video"
-        match = re.match(r'^(.+?)_\d+$', name_without_ext)
+        # e.g., "video_00003" -> "video" (split on the last underscore rather
+        # than running a regex; isdecimal() accepts exactly what \d does)
+        prefix, underscore, number = name_without_ext.rpartition('_')
 
-        if match:
-            return match.group(1)
+        if prefix and underscore and number.isdecimal():
+            return prefix
         else:
             # If no pattern found, return the whole name without extension
             return name_without_ext
@@ -502,20 +1316,63 @@ class VideoStitching:
             list: Sorted list of Path objects for matching videos
         """
         # Find all files matching the pattern: {prefix}_*.mp4
-        pattern = f"{prefix}_*.mp4"
-        matching_files = list(directory.glob(pattern))
+        # One listdir plus fnmatch.filter (a single cached regex over all names)
+        # avoids glob's per-entry Path objects; Paths are built for matches only.
+        # fnmatch follows the OS's case rules like glob did (case-insensitive on
+        # Windows), and glob.escape keeps "[" etc. in the prefix literal.
+        pattern = f"{glob.escape(prefix)}_*.mp4"
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            # A missing directory simply has no matches, as it did with glob
+            return []
+        matching_files = [
+            directory / name
+            for name in fnmatch.filter(names, pattern)
+        ]
 
-        # Sort by filename (natural sort order)
-        matching_files.sort(key=lambda x: x.name)
+        # Sort by sequence number, so unpadded "_10" doesn't land before "_9"
+        matching_files.sort(key=_sequence_key)
 
         return matching_files
 
+    def _link_single_video(self, video_file, output_dir, output_prefix):
+        """
+        Produce the "stitched" output for a single video without running ffmpeg.
+
+        Hardlinks the video to the output name, which is instant on the same
+        filesystem, and falls back to a plain file copy where links aren't
+        supported.
+
+        Args:
+            video_file (Path): The only video found
+            output_dir (Path): Output directory
+            output_prefix (str): Prefix for output filename
+
+        Returns:
+            Path: Path to the output video
+        """
+        counter = next_counter(output_dir, output_prefix, ext="mp4")
+        output_filename = f"{output_prefix}_{counter:05d}.mp4"
+        output_path = output_dir / output_filename
+
+        logger.debug("📝 Output will be: %s", output_filename)
+
+        try:
+            os.link(video_file, output_path)
+            logger.debug("🔗 Only one video found, linked it instead of re-muxing")
+        except OSError:
+            shutil.copyfile(video_file, output_path)
+            logger.debug("📋 Only one video found, copied it instead of re-muxing")
+
+        return output_path
+
     def _stitch_with_ffmpeg(self, video_files, output_dir, output_prefix):
         """
         Stitch multiple videos using ffmpeg concat demuxer (no re-encoding).
 
         Args:
-            video_files (list): List of Path objects for videos to stitch
+            video_files (list): List of absolute Path objects for videos to stitch
             output_dir (Path): Output directory
             output_prefix (str): Prefix for output filename
 
@@ -523,69 +1380,39 @@ class VideoStitching:
             Path: Path to the stitched output video
         """
         # Find next available sequential number for output filename
-        counter = 1
-        while True:
-            output_filename = f"{output_prefix}_{counter:05d}.mp4"
-            output_path = output_dir / output_filename
-            if not output_path.exists():
-                break
-            counter += 1
-
-        print(f"📝 Output will be: {output_filename}")
+        counter = next_counter(output_dir, output_prefix, ext="mp4")
+        output_filename = f"{output_prefix}_{counter:05d}.mp4"
+        output_path = output_dir / output_filename
 
-        # Create a temporary file list for ffmpeg concat
-        concat_file = output_dir / f"{output_prefix}_concat_list.txt"
+        logger.debug("📝 Output will be: %s", output_filename)
 
-        # Write the concat file format required by ffmpeg
-        with open(concat_file, 'w', encoding='utf-8') as f:
-            for video in video_files:
-                # Use absolute path and escape special characters for ffmpeg
-                # Convert Windows backslashes to forward slashes
-                escaped_path = str(video.absolute()).replace('\\', '/')
-                f.write(f"file '{escaped_path}'\n")
+        # Build the file list in the concat format required by ffmpeg. It's fed
+        # to ffmpeg's stdin, so no temporary list file is written or cleaned up
+        # Windows backslashes are converted to forward slashes, and the file:
+        # scheme stops ffmpeg resolving paths relative to "pipe:"
+        escaped_paths = [os.fspath(video).replace('\\', '/') for video in video_files]
+        manifest = "\n".join(f"file 'file:{path}'" for path in escaped_paths) + "\n"
 
         # Build ffmpeg command (concat without re-encoding)
         ffmpeg_cmd = [
-            'ffmpeg',
+            _FFMPEG,
             '-f', 'concat',           # Use concat demuxer
             '-safe', '0',              # Allow absolute paths
-            '-i', str(concat_file),    # Input concat file
+            '-protocol_whitelist', 'file,pipe',  # Read the list from a pipe, clips from files
+            # Larger demuxer->muxer packet queue, so ffmpeg >= 6's threaded demuxing
+            # doesn't stall on a full queue while copying long clips
+            '-thread_queue_size', '1024',
+            '-i', 'pipe:0',            # Input concat list from stdin
             '-c', 'copy',              # Copy codec (no re-encoding)
             '-y',                      # Overwrite output file
             str(output_path)           # Output file
         ]
 
-        print(f"🎥 Running ffmpeg to stitch {len(video_files)} videos...")
+        logger.debug("🎥 Running ffmpeg to stitch %d videos...", len(video_files))
 
-        try:
-            # Run ffmpeg
-            result = subprocess.run(
-                ffmpeg_cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            # Clean up concat file
-            if concat_file.exists():
-                concat_file.unlink()
-
-            return output_path
-
-        except subprocess.CalledProcessError as e:
-            error_msg = f"ffmpeg failed: {e.stderr}"
-            print(f"❌ {error_msg}")
-
-            # Clean up concat file even on failure
-            if concat_file.exists():
-                concat_file.unlink()
-
-            raise RuntimeError(error_msg)
-        except FileNotFoundError:
-            raise RuntimeError(
-                "ffmpeg not found. Please install ffmpeg and add it to your PATH."
-            )
+        _run_ffmpeg(ffmpeg_cmd, stdin_data=manifest)
+        return output_path
 
 
 # Export nodes from this module
-__all__ = ['SubtitleBurnIn', 'VideoStitching']
+__all__ = ['SubtitleBurnIn', 'BatchSubtitleBurnIn', 'VideoStitching']